@@ -0,0 +1,31 @@
+"""
+Optional Numba JIT support.
+
+Numba is an optional dependency (``pip install kintsugi[jit]``). When it
+is not installed `njit` returns functions unchanged, so decorated kernels
+still run as ordinary Python. Callers should check `HAS_NUMBA` and prefer
+their NumPy path in that case.
+"""
+
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+try:
+    import numba
+
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+def njit(**options: Any) -> Callable[[F], F]:
+    """Compile with `numba.njit` when available, otherwise a no-op."""
+    if HAS_NUMBA:
+        return numba.njit(**options)  # type: ignore[no-any-return]
+
+    def passthrough(fn: F) -> F:
+        return fn
+
+    return passthrough
@@ -5,11 +5,14 @@ Handles composition of 2D drawings including dimensions,
 hatching, and annotation layers.
 """
 
-from dataclasses import dataclass, field
-from decimal import Decimal
-from fractions import Fraction
+import math
+import weakref
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
 from typing import Literal
 
+import numpy as np
+
 PALETTE = {
     "ink": "#3a2a1a",
     "brown": "#6b3a1f",
@@ -26,28 +29,67 @@ STROKE_MEDIUM = "1.2"
 STROKE_LIGHT = "0.75"
 
 
+@lru_cache(maxsize=4096)
 def to_shop_fraction(value: float, precision: int = 16) -> str:
     """
     Format a decimal inch value as a shop fraction string.
 
+    The fractional part is snapped to the nearest 1/``precision`` inch,
+    with exact halves rounding up, and reduced, so the default gives
+    sixteenths.
+
     Examples:
         0.625  → 5/8"
         1.75   → 1 3/4"
         3.0    → 3"
     """
-    if value < 0:
-        return f"-{to_shop_fraction(-value, precision)}"
-    d = Decimal(str(round(value, 6)))
-    whole = int(d)
-    frac_val = d - whole
-    if frac_val == 0:
-        return f'{whole}"'
-    frac = Fraction(frac_val).limit_denominator(precision)
-    if frac.numerator == frac.denominator:
-        return f'{whole + 1}"'
+    sign = "-" if value < 0 else ""
+    value = abs(value)
+    whole = int(value)
+    # Round half up; builtin round() would send 1/32" down but 3/32" up
+    numerator = math.floor((value - whole) * precision + 0.5)
+    if numerator == precision:
+        whole += 1
+        numerator = 0
+    if numerator == 0:
+        return f'{sign}{whole}"' if whole else '0"'
+    g = math.gcd(numerator, precision)
+    frac = f"{numerator // g}/{precision // g}"
     if whole == 0:
-        return f'{frac.numerator}/{frac.denominator}"'
-    return f'{whole} {frac.numerator}/{frac.denominator}"'
+        return f'{sign}{frac}"'
+    return f'{sign}{whole} {frac}"'
+
+
+# Arrays created by _as_path, keyed by id. Only these own their data and are
+# known never to change, so exporters may cache output derived from them.
+_frozen_paths: "weakref.WeakValueDictionary[int, np.ndarray]" = (
+    weakref.WeakValueDictionary()
+)
+
+
+def _is_frozen_path(path: object) -> bool:
+    """Whether ``path`` is an immutable array stored by the builders."""
+    return _frozen_paths.get(id(path)) is path
+
+
+def _as_path(path: np.ndarray | list[tuple[float, float]]) -> np.ndarray:
+    """
+    Copy a sequence of (x, y) points into a read-only (N, 2) float32 array.
+
+    Stored paths are immutable so exporters can safely cache per-path
+    output between renders.
+
+    Raises:
+        ValueError: If the points are not (x, y) pairs.
+    """
+    arr = np.array(path, dtype=np.float32)
+    if arr.size == 0:
+        arr = arr.reshape(0, 2)
+    elif arr.ndim != 2 or arr.shape[1] != 2:
+        raise ValueError(f"path must be a sequence of (x, y) points, got {arr.shape}")
+    arr.flags.writeable = False
+    _frozen_paths[id(arr)] = arr
+    return arr
 
 
 @dataclass
@@ -108,10 +150,44 @@ class Drawing:
     hatches: list[HatchRegion] = field(default_factory=list)
     centerlines: list[CenterLine] = field(default_factory=list)
 
-    sketch_paths: list[list[tuple[float, float]]] = field(default_factory=list)
-    text_paths: list[list[tuple[float, float]]] = field(default_factory=list)
+    # The add_* builders store read-only arrays; point lists appended
+    # directly are still accepted by the exporters
+    sketch_paths: list[np.ndarray | list[tuple[float, float]]] = field(
+        default_factory=list
+    )
+    text_paths: list[np.ndarray | list[tuple[float, float]]] = field(
+        default_factory=list
+    )
     labels: list[tuple[str, float, float, str]] = field(default_factory=list)
 
+    # Exporter cache of path data keyed by (id(path), precision); each entry
+    # keeps its path alive so ids stay valid. See export.svg.write_svg.
+    _svg_cache: dict[tuple[int, int], tuple[np.ndarray, str]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Compare drawings field by field.
+
+        Path arrays compare elementwise under ``==``, so the path lists
+        are matched point for point with `np.array_equal` instead.
+        """
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        for f in fields(self):
+            if not f.compare:
+                continue
+            mine, theirs = getattr(self, f.name), getattr(other, f.name)
+            if f.name in ("sketch_paths", "text_paths"):
+                if len(mine) != len(theirs) or not all(
+                    np.array_equal(a, b) for a, b in zip(mine, theirs)
+                ):
+                    return False
+            elif mine != theirs:
+                return False
+        return True
+
     def add_dimension(
         self, x1: float, y1: float, x2: float, y2: float, label: str = ""
     ) -> "Drawing":
@@ -134,14 +210,16 @@ class Drawing:
         self.centerlines.append(CenterLine(x1, y1, x2, y2))
         return self
 
-    def add_sketch_path(self, path: list[tuple[float, float]]) -> "Drawing":
-        """Add a wabi-sabi sketch path."""
-        self.sketch_paths.append(path)
+    def add_sketch_path(
+        self, path: np.ndarray | list[tuple[float, float]]
+    ) -> "Drawing":
+        """Add a wabi-sabi sketch path, stored as an (N, 2) float32 array."""
+        self.sketch_paths.append(_as_path(path))
         return self
 
-    def add_text_path(self, path: list[tuple[float, float]]) -> "Drawing":
-        """Add a text stroke path."""
-        self.text_paths.append(path)
+    def add_text_path(self, path: np.ndarray | list[tuple[float, float]]) -> "Drawing":
+        """Add a text stroke path, stored as an (N, 2) float32 array."""
+        self.text_paths.append(_as_path(path))
         return self
 
     def add_label(
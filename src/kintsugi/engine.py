@@ -5,10 +5,13 @@ Allows swapping between different CAD backends (build123d, etc.)
 while maintaining a consistent interface for kintsugi.
 """
 
+import math
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Any
 
+import numpy as np
+
 
 @dataclass
 class Sketch:
@@ -51,6 +54,16 @@ class CADEngine(ABC):
         ...
 
 
+def _edge_row(edge: Any, curve: Any) -> tuple[float, ...]:
+    """Flatten a projected edge into a numeric row for `project_3d_to_2d`."""
+    start = curve.start_point
+    end = curve.end_point
+    if hasattr(curve, "radius") and curve.radius:
+        center = edge.position
+        return (start.X, start.Y, end.X, end.Y, curve.radius, center.X, center.Y)
+    return (start.X, start.Y, end.X, end.Y, math.nan, math.nan, math.nan)
+
+
 class Build123dEngine(CADEngine):
     """build123d CAD engine implementation."""
 
@@ -63,23 +76,25 @@ class Build123dEngine(CADEngine):
 
         projected = Project(part).do_sort_by_distance(plane)
 
-        lines: list[tuple[float, float, float, float]] = []
-        arcs: list[tuple[float, float, float, float, float]] = []
-        circles: list[tuple[float, float, float]] = []
-
-        for edge in projected.edges:
-            if hasattr(edge, "curve") and edge.curve:
-                curve = edge.curve
-                if hasattr(curve, "start_point") and hasattr(curve, "end_point"):
-                    start = curve.start_point
-                    end = curve.end_point
-                    if hasattr(curve, "radius") and curve.radius:
-                        center = edge.position
-                        circles.append((center.X, center.Y, curve.radius))
-                    else:
-                        lines.append((start.X, start.Y, end.X, end.Y))
-
-        return Sketch(lines=lines, arcs=arcs, circles=circles)
+        rows = [
+            _edge_row(edge, curve)
+            for edge in projected.edges
+            if hasattr(edge, "curve")
+            and (curve := edge.curve)
+            and hasattr(curve, "start_point")
+            and hasattr(curve, "end_point")
+        ]
+        if not rows:
+            return Sketch.empty()
+
+        # One row per edge: start xy, end xy, radius, centre xy (NaN for lines)
+        data = np.array(rows, dtype=np.float64)
+        is_circle = ~np.isnan(data[:, 4])
+
+        lines = [(sx, sy, ex, ey) for sx, sy, ex, ey in data[~is_circle, :4].tolist()]
+        circles = [(cx, cy, r) for r, cx, cy in data[is_circle, 4:].tolist()]
+
+        return Sketch(lines=lines, arcs=[], circles=circles)
 
     def get_edges(self, part: Any) -> list[Any]:
         return part.edges() if hasattr(part, "edges") else []
@@ -1,5 +1,5 @@
 """SVG export for kintsugi drawings."""
 
-from .svg import render_to_svg
+from .svg import render_to_svg, write_svg
 
-__all__ = ["render_to_svg"]
+__all__ = ["render_to_svg", "write_svg"]
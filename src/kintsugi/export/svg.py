@@ -4,7 +4,12 @@ SVG export for kintsugi drawings.
 Renders Drawing objects to SVG strings with wabi-sabi styling.
 """
 
+import io
 import math
+from collections.abc import Sequence
+from typing import TextIO
+
+import numpy as np
 
 from ..drawing import (
     PALETTE,
@@ -16,203 +21,360 @@ from ..drawing import (
     Dimension,
     Drawing,
     HatchRegion,
+    _is_frozen_path,
 )
 
+_INK = PALETTE["ink"]
+_AMBER = PALETTE["amber"]
+_CREAM = PALETTE["cream"]
+_BROWN = PALETTE["brown"]
+_HATCH = PALETTE["hatch"]
 
-def _points_to_svg(points: list[tuple[float, float]]) -> str:
-    """Convert a list of points to an SVG path d attribute."""
-    if not points:
-        return ""
-    d = f"M {points[0][0]:.2f},{points[0][1]:.2f}"
-    for x, y in points[1:]:
-        d += f" L {x:.2f},{y:.2f}"
-    return d
 
+def _points_to_svg(points: np.ndarray, precision: int = 2) -> str:
+    """
+    Convert an (N, 2) array of points to an SVG path d attribute.
 
-def _arrow_head(x: float, y: float, angle_deg: float, size: float = 6.0) -> str:
-    """Render a filled arrow head."""
-    rad = math.radians(angle_deg)
-    tip_x, tip_y = x, y
-    b1_x = tip_x - size * math.cos(rad) + (size * 0.4) * math.sin(rad)
-    b1_y = tip_y - size * math.sin(rad) - (size * 0.4) * math.cos(rad)
-    b2_x = tip_x - size * math.cos(rad) - (size * 0.4) * math.sin(rad)
-    b2_y = tip_y - size * math.sin(rad) + (size * 0.4) * math.cos(rad)
-    return (
-        f'<polygon points="{tip_x:.2f},{tip_y:.2f} '
-        f"{b1_x:.2f},{b1_y:.2f} "
-        f'{b2_x:.2f},{b2_y:.2f}" '
-        f'fill="{PALETTE["amber"]}" />'
-    )
+    The whole path is formatted by a single ``%`` operation over a
+    template repeated once per point, keeping the per-point loop in C.
+    """
+    if len(points) == 0:
+        return ""
+    pair = f"%.{precision}f,%.{precision}f"
+    template = "M " + pair + (" L " + pair) * (len(points) - 1)
+    return template % tuple(points.ravel().tolist())
 
 
-def _render_dimension(d: Dimension) -> str:
-    """Render a dimension line."""
-    dx = d.x2 - d.x1
-    dy = d.y2 - d.y1
-    length_px = math.hypot(dx, dy)
-    if length_px < 1:
-        return ""
+_ARROW_MARKER_ID = "dim-arrow"
 
-    perp_x = -dy / length_px
-    perp_y = dx / length_px
 
-    if d.side in ("below", "right"):
-        perp_x, perp_y = -perp_x, -perp_y
+def _arrow_marker_defs() -> str:
+    """Define the shared arrow head used at both ends of dimension lines."""
+    return (
+        f'<defs><marker id="{_ARROW_MARKER_ID}" viewBox="0 0 6 6" refX="6" refY="3" '
+        f'markerWidth="6" markerHeight="6" markerUnits="userSpaceOnUse" '
+        f'orient="auto-start-reverse">'
+        f'<polygon points="0,0.6 6,3 0,5.4" fill="{_AMBER}" />'
+        f"</marker></defs>"
+    )
 
-    ox = perp_x * d.offset
-    oy = perp_y * d.offset
 
-    lx1, ly1 = d.x1 + ox, d.y1 + oy
-    lx2, ly2 = d.x2 + ox, d.y2 + oy
+def _render_dimensions_batch(dims: list[Dimension], precision: int = 2) -> str:
+    """
+    Render dimension lines for a batch of dimensions at once.
+
+    Geometry for every dimension is computed together as NumPy arrays
+    and then formatted in a single pass. Dimensions shorter than one
+    pixel are skipped. Stroke colour and the light stroke width are
+    inherited from the enclosing dimension group emitted by
+    `render_to_svg`.
+    """
+    p = precision
+    x1 = np.array([d.x1 for d in dims], dtype=np.float64)
+    y1 = np.array([d.y1 for d in dims], dtype=np.float64)
+    x2 = np.array([d.x2 for d in dims], dtype=np.float64)
+    y2 = np.array([d.y2 for d in dims], dtype=np.float64)
+    offset = np.array([d.offset for d in dims], dtype=np.float64)
+    flip = np.array([d.side in ("below", "right") for d in dims])
+
+    dx = x2 - x1
+    dy = y2 - y1
+    length_px = np.hypot(dx, dy)
+    visible = length_px >= 1
+    safe_length = np.where(visible, length_px, 1.0)
+
+    sign = np.where(flip, -1.0, 1.0)
+    perp_x = -dy / safe_length * sign
+    perp_y = dx / safe_length * sign
+
+    lx1 = x1 + perp_x * offset
+    ly1 = y1 + perp_y * offset
+    lx2 = x2 + perp_x * offset
+    ly2 = y2 + perp_y * offset
 
     ext_gap = 2.0
-    ext_x1 = d.x1 + perp_x * ext_gap
-    ext_y1 = d.y1 + perp_y * ext_gap
-    ext_x2 = d.x2 + perp_x * ext_gap
-    ext_y2 = d.y2 + perp_y * ext_gap
-
-    line_angle = math.degrees(math.atan2(dy, dx))
-    arrow1_angle = line_angle + 180
-    arrow2_angle = line_angle
-
-    mid_x = (lx1 + lx2) / 2
-    mid_y = (ly1 + ly2) / 2
-    label_x = mid_x + perp_x * 8
-    label_y = mid_y + perp_y * 8
-
-    label = d.label or ""
-
-    parts = [
-        f'<line x1="{ext_x1:.2f}" y1="{ext_y1:.2f}" x2="{lx1:.2f}" y2="{ly1:.2f}" '
-        f'stroke="{PALETTE["amber"]}" stroke-width="{STROKE_LIGHT}" />',
-        f'<line x1="{ext_x2:.2f}" y1="{ext_y2:.2f}" x2="{lx2:.2f}" y2="{ly2:.2f}" '
-        f'stroke="{PALETTE["amber"]}" stroke-width="{STROKE_LIGHT}" />',
-        f'<line x1="{lx1:.2f}" y1="{ly1:.2f}" x2="{lx2:.2f}" y2="{ly2:.2f}" '
-        f'stroke="{PALETTE["amber"]}" stroke-width="{STROKE_MEDIUM}" />',
-        _arrow_head(lx1, ly1, arrow1_angle),
-        _arrow_head(lx2, ly2, arrow2_angle),
-    ]
-
-    if label:
-        parts.append(
-            f'<rect x="{label_x - 18:.2f}" y="{label_y - 7:.2f}" '
-            f'width="36" height="14" rx="2" '
-            f'fill="{PALETTE["cream"]}" opacity="0.85" />'
-        )
+    ext_x1 = x1 + perp_x * ext_gap
+    ext_y1 = y1 + perp_y * ext_gap
+    ext_x2 = x2 + perp_x * ext_gap
+    ext_y2 = y2 + perp_y * ext_gap
+
+    label_x = (lx1 + lx2) / 2 + perp_x * 8
+    label_y = (ly1 + ly2) / 2 + perp_y * 8
+
+    rows = zip(
+        dims,
+        visible.tolist(),
+        ext_x1.tolist(),
+        ext_y1.tolist(),
+        ext_x2.tolist(),
+        ext_y2.tolist(),
+        lx1.tolist(),
+        ly1.tolist(),
+        lx2.tolist(),
+        ly2.tolist(),
+        label_x.tolist(),
+        label_y.tolist(),
+    )
+
+    parts = []
+    for d, shown, ex1, ey1, ex2, ey2, ax1, ay1, ax2, ay2, tx, ty in rows:
+        if not shown:
+            continue
         parts.append(
-            f'<text x="{label_x:.2f}" y="{label_y + 4:.2f}" '
-            f'text-anchor="middle" font-family="serif" font-size="10" '
-            f'fill="{PALETTE["amber"]}">{label}</text>'
+            f'<line x1="{ex1:.{p}f}" y1="{ey1:.{p}f}" '
+            f'x2="{ax1:.{p}f}" y2="{ay1:.{p}f}" />\n'
+            f'<line x1="{ex2:.{p}f}" y1="{ey2:.{p}f}" '
+            f'x2="{ax2:.{p}f}" y2="{ay2:.{p}f}" />\n'
+            f'<line x1="{ax1:.{p}f}" y1="{ay1:.{p}f}" '
+            f'x2="{ax2:.{p}f}" y2="{ay2:.{p}f}" '
+            f'stroke-width="{STROKE_MEDIUM}" '
+            f'marker-start="url(#{_ARROW_MARKER_ID})" marker-end="url(#{_ARROW_MARKER_ID})" />'
         )
+        if d.label:
+            parts.append(
+                f'<rect x="{tx - 18:.{p}f}" y="{ty - 7:.{p}f}" '
+                f'width="36" height="14" rx="2" '
+                f'fill="{_CREAM}" stroke="none" opacity="0.85" />\n'
+                f'<text x="{tx:.{p}f}" y="{ty + 4:.{p}f}" '
+                f'text-anchor="middle" font-family="serif" font-size="10" '
+                f'fill="{_AMBER}" stroke="none">{d.label}</text>'
+            )
 
     return "\n".join(parts)
 
 
-def _render_callout(c: Callout) -> str:
+def _render_callout(c: Callout, precision: int = 2) -> str:
     """Render a callout bubble."""
+    p = precision
     circled = "①②③④⑤⑥⑦⑧⑨"
     char = circled[c.number - 1] if 1 <= c.number <= 9 else str(c.number)
     return (
-        f'<circle cx="{c.x:.2f}" cy="{c.y:.2f}" r="{c.radius:.2f}" '
-        f'fill="{PALETTE["cream"]}" stroke="{PALETTE["amber"]}" '
+        f'<circle cx="{c.x:.{p}f}" cy="{c.y:.{p}f}" r="{c.radius:.{p}f}" '
+        f'fill="{_CREAM}" stroke="{_AMBER}" '
         f'stroke-width="{STROKE_MEDIUM}" />'
-        f'<text x="{c.x:.2f}" y="{c.y + 4.5:.2f}" '
+        f'<text x="{c.x:.{p}f}" y="{c.y + 4.5:.{p}f}" '
         f'text-anchor="middle" font-family="serif" font-size="{c.radius * 1.2:.1f}" '
-        f'fill="{PALETTE["amber"]}">{char}</text>'
+        f'fill="{_AMBER}">{char}</text>'
     )
 
 
-def _render_hatch(h: HatchRegion) -> str:
-    """Render diagonal hatching."""
-    import itertools
+def _render_hatch(h: HatchRegion, clip_id: str, precision: int = 2) -> str:
+    """
+    Render diagonal hatching.
 
-    clip_id = f"hatch-clip-{next(itertools.count(1))}"
+    ``clip_id`` names the region's clip path and must be unique within
+    the document.
+    """
+    p = precision
     angle_rad = math.radians(h.angle_deg)
     cos_a = math.cos(angle_rad)
     sin_a = math.sin(angle_rad)
 
-    lines = []
     diagonal = math.hypot(h.width, h.height)
-    t = -diagonal
-    while t <= diagonal * 2:
-        cx = h.x + h.width / 2 + t * cos_a
-        cy = h.y + h.height / 2 + t * sin_a
-        perp_len = diagonal
-        lx1 = cx + perp_len * (-sin_a)
-        ly1 = cy + perp_len * cos_a
-        lx2 = cx - perp_len * (-sin_a)
-        ly2 = cy - perp_len * cos_a
-        lines.append(
-            f'<line x1="{lx1:.2f}" y1="{ly1:.2f}" '
-            f'x2="{lx2:.2f}" y2="{ly2:.2f}" '
-            f'stroke="{PALETTE["hatch"]}" stroke-width="{STROKE_LIGHT}" />'
+    ts = np.arange(-diagonal, diagonal * 2, h.spacing)
+    cx = h.x + h.width / 2 + ts * cos_a
+    cy = h.y + h.height / 2 + ts * sin_a
+    perp_len = diagonal
+    lx1 = cx - perp_len * sin_a
+    ly1 = cy + perp_len * cos_a
+    lx2 = cx + perp_len * sin_a
+    ly2 = cy - perp_len * cos_a
+
+    d = " ".join(
+        f"M {x1:.{p}f},{y1:.{p}f} L {x2:.{p}f},{y2:.{p}f}"
+        for x1, y1, x2, y2 in zip(
+            lx1.tolist(), ly1.tolist(), lx2.tolist(), ly2.tolist()
         )
-        t += h.spacing
+    )
 
     return (
         f'<defs><clipPath id="{clip_id}">'
-        f'<rect x="{h.x:.2f}" y="{h.y:.2f}" '
-        f'width="{h.width:.2f}" height="{h.height:.2f}" /></clipPath></defs>'
-        f'<g clip-path="url(#{clip_id})" opacity="0.5">' + "\n".join(lines) + "</g>"
+        f'<rect x="{h.x:.{p}f}" y="{h.y:.{p}f}" '
+        f'width="{h.width:.{p}f}" height="{h.height:.{p}f}" /></clipPath></defs>'
+        f'<g clip-path="url(#{clip_id})" opacity="0.5">'
+        f'<path d="{d}" fill="none" stroke="{_HATCH}" '
+        f'stroke-width="{STROKE_LIGHT}" /></g>'
     )
 
 
-def _render_centerline(c: CenterLine) -> str:
-    """Render a center line."""
+def _render_centerline(c: CenterLine, precision: int = 2) -> str:
+    """
+    Render a center line.
+
+    Stroke styling is inherited from the enclosing centerline group
+    emitted by `render_to_svg`.
+    """
+    p = precision
     return (
-        f'<line x1="{c.x1:.2f}" y1="{c.y1:.2f}" '
-        f'x2="{c.x2:.2f}" y2="{c.y2:.2f}" '
-        f'stroke="{PALETTE["amber"]}" '
-        f'stroke-width="{STROKE_LIGHT}" '
-        f'stroke-dasharray="8,3,2,3" '
-        f'opacity="0.7" />'
+        f'<line x1="{c.x1:.{p}f}" y1="{c.y1:.{p}f}" '
+        f'x2="{c.x2:.{p}f}" y2="{c.y2:.{p}f}" />'
     )
 
 
-def render_to_svg(drawing: Drawing) -> str:
-    """Render a Drawing to an SVG string."""
-    svg_parts = [
-        f'<svg xmlns="http://www.w3.org/2000/svg" '
-        f'viewBox="0 0 {drawing.width} {drawing.height}" '
-        f'width="{drawing.width}" height="{drawing.height}">',
-        f'<rect width="100%" height="100%" fill="{drawing.background}" />',
-    ]
-
-    for path in drawing.sketch_paths:
-        d = _points_to_svg(path)
-        if d:
-            svg_parts.append(
-                f'<path d="{d}" fill="none" stroke="{PALETTE["ink"]}" '
-                f'stroke-width="{STROKE_HEAVY}" stroke-linecap="round" />'
-            )
+_PathCache = dict[tuple[int, int], tuple[np.ndarray, str]]
+
+
+def _cached_points_to_svg(
+    path: np.ndarray | list[tuple[float, float]],
+    precision: int,
+    previous: _PathCache,
+    current: _PathCache | None,
+) -> str:
+    """
+    `_points_to_svg` with reuse of output from the previous render.
+
+    Only arrays stored by the ``Drawing.add_*`` builders are cached, since
+    only their contents are known never to change; read-only views,
+    broadcasts and memmaps can still change underneath. Plain point
+    sequences appended directly to a drawing are converted on the fly.
+    Entries used in this render are copied to ``current`` so paths
+    dropped from the drawing are not kept alive; nothing is cached when
+    ``current`` is None.
+    """
+    if not isinstance(path, np.ndarray):
+        return _points_to_svg(np.asarray(path, dtype=np.float64), precision)
+    if current is None or not _is_frozen_path(path):
+        return _points_to_svg(path, precision)
+    key = (id(path), precision)
+    hit = previous.get(key)
+    if hit is not None and hit[0] is path:
+        d = hit[1]
+    else:
+        d = _points_to_svg(path, precision)
+    current[key] = (path, d)
+    return d
 
-    for path in drawing.text_paths:
-        d = _points_to_svg(path)
-        if d:
-            svg_parts.append(
-                f'<path d="{d}" fill="none" stroke="{PALETTE["brown"]}" '
-                f'stroke-width="{STROKE_MEDIUM}" stroke-linecap="round" stroke-linejoin="round" />'
-            )
 
-    for h in drawing.hatches:
-        svg_parts.append(_render_hatch(h))
+def _write_merged_path(
+    fp: TextIO,
+    paths: Sequence[np.ndarray | list[tuple[float, float]]],
+    attrs: str,
+    precision: int,
+    previous: _PathCache,
+    current: _PathCache | None,
+) -> None:
+    """Stream same-style paths as subpaths of a single path element."""
+    subpaths = (
+        _cached_points_to_svg(path, precision, previous, current)
+        for path in paths
+        if len(path)
+    )
+    first = next(subpaths, None)
+    if first is None:
+        return
+    fp.write('<path d="')
+    fp.write(first)
+    for d in subpaths:
+        fp.write(" ")
+        fp.write(d)
+    fp.write(f'" {attrs} />\n')
+
+
+def write_svg(
+    drawing: Drawing, fp: TextIO, precision: int = 2, cache: bool = False
+) -> None:
+    """
+    Write a Drawing as SVG to a text stream.
+
+    Elements are written as they are generated, so large drawings can
+    go straight to a file, socket or compressor without building the
+    whole document in memory.
+
+    With ``cache=True`` the formatted path data of every builder-stored
+    path is kept on the drawing, so re-rendering after small edits only
+    formats new paths. That trades memory for speed: the drawing then
+    holds its full path payload between renders, which streaming alone
+    avoids.
+
+    Args:
+        drawing: The drawing to render
+        fp: Writable text stream
+        precision: Decimal places for coordinates; 1 or even 0 is
+            usually plenty for the hand-drawn style and shrinks output
+        cache: Reuse and keep per-path output between renders
+    """
+    p = precision
+    fp.write(
+        f'<svg xmlns="http://www.w3.org/2000/svg" '
+        f'viewBox="0 0 {drawing.width} {drawing.height}" '
+        f'width="{drawing.width}" height="{drawing.height}">\n'
+        f'<rect width="100%" height="100%" fill="{drawing.background}" />\n'
+    )
 
-    for c in drawing.centerlines:
-        svg_parts.append(_render_centerline(c))
+    previous = drawing._svg_cache if cache else {}
+    current: _PathCache | None = {} if cache else None
+    _write_merged_path(
+        fp,
+        drawing.sketch_paths,
+        f'fill="none" stroke="{_INK}" '
+        f'stroke-width="{STROKE_HEAVY}" stroke-linecap="round"',
+        p,
+        previous,
+        current,
+    )
+    _write_merged_path(
+        fp,
+        drawing.text_paths,
+        f'fill="none" stroke="{_BROWN}" '
+        f'stroke-width="{STROKE_MEDIUM}" stroke-linecap="round" stroke-linejoin="round"',
+        p,
+        previous,
+        current,
+    )
+    if current is not None:
+        drawing._svg_cache = current
+
+    # Clip ids are numbered per document so identical drawings render to
+    # identical output
+    for n, h in enumerate(drawing.hatches, 1):
+        fp.write(_render_hatch(h, f"hatch-clip-{n}", p))
+        fp.write("\n")
+
+    if drawing.centerlines:
+        fp.write(
+            f'<g fill="none" stroke="{_AMBER}" '
+            f'stroke-width="{STROKE_LIGHT}" stroke-dasharray="8,3,2,3" '
+            f'stroke-opacity="0.7">\n'
+        )
+        for c in drawing.centerlines:
+            fp.write(_render_centerline(c, p))
+            fp.write("\n")
+        fp.write("</g>\n")
 
-    for dim in drawing.dimensions:
-        svg_parts.append(_render_dimension(dim))
+    if drawing.dimensions:
+        fp.write(_arrow_marker_defs())
+        fp.write(f'\n<g fill="none" stroke="{_AMBER}" stroke-width="{STROKE_LIGHT}">\n')
+        fp.write(_render_dimensions_batch(drawing.dimensions, p))
+        fp.write("\n</g>\n")
 
     for callout in drawing.callouts:
-        svg_parts.append(_render_callout(callout))
+        fp.write(_render_callout(callout, p))
+        fp.write("\n")
 
     for text, x, y, style in drawing.labels:
-        fill = PALETTE["amber"] if style == "dimension" else PALETTE["brown"]
-        svg_parts.append(
-            f'<text x="{x:.2f}" y="{y:.2f}" '
-            f'font-family="serif" font-size="10" fill="{fill}">{text}</text>'
+        fill = _AMBER if style == "dimension" else _BROWN
+        fp.write(
+            f'<text x="{x:.{p}f}" y="{y:.{p}f}" '
+            f'font-family="serif" font-size="10" fill="{fill}">{text}</text>\n'
         )
 
-    svg_parts.append("</svg>")
+    fp.write("</svg>")
+
+
+def render_to_svg(drawing: Drawing, precision: int = 2, cache: bool = False) -> str:
+    """
+    Render a Drawing to an SVG string.
+
+    Args:
+        drawing: The drawing to render
+        precision: Decimal places for coordinates; 1 or even 0 is
+            usually plenty for the hand-drawn style and shrinks output
+        cache: Keep per-path output on the drawing for faster
+            re-renders, at the memory cost described in `write_svg`
 
-    return "\n".join(svg_parts)
+    Returns:
+        SVG document as a string
+    """
+    buf = io.StringIO()
+    write_svg(drawing, buf, precision, cache)
+    return buf.getvalue()
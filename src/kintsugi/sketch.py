@@ -10,6 +10,8 @@ from dataclasses import dataclass
 
 import numpy as np
 
+from kintsugi._jit import HAS_NUMBA, njit
+
 
 @dataclass
 class SketchConfig:
@@ -21,68 +23,143 @@ class SketchConfig:
 
 
 def simplex_noise_2d(x: float, y: float, seed: int | None = None) -> float:
-    """Generate 2D simplex-like noise for coordinates."""
-    vec = np.array([x, y])
-    return float(np.sin(vec[0] * 12.9898 + vec[1] * 78.233) * 43758.5453 % 1)
+    """
+    Generate 2D pseudo-noise in [0, 1) for coordinates.
+
+    Despite the name this is a cheap sine hash rather than true simplex
+    noise; it is scalar math only, the array paths use `_noise_2d`.
+    """
+    return math.sin(x * 12.9898 + y * 78.233) * 43758.5453 % 1.0
+
+
+def _noise_2d(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """Vectorized form of `simplex_noise_2d` over coordinate arrays."""
+    return np.mod(np.sin(x * 12.9898 + y * 78.233) * 43758.5453, 1.0)
+
+
+@njit(cache=True)
+def _perturb_line_kernel(
+    x1: float,
+    y1: float,
+    x2: float,
+    y2: float,
+    noise_scale: float,
+    noise_amplitude: float,
+    num_points: int,
+) -> np.ndarray:
+    """Scalar-loop form of `perturb_line` for Numba; returns an (N, 2) array."""
+    dx = x2 - x1
+    dy = y2 - y1
+    length = math.hypot(dx, dy)
+    nx = -dy / length
+    ny = dx / length
+
+    out = np.empty((num_points + 1, 2))
+    for i in range(num_points + 1):
+        t = i / num_points
+        base_x = x1 + dx * t
+        base_y = y1 + dy * t
+        noise = (
+            math.sin(
+                (base_x * noise_scale + t) * 12.9898 + base_y * noise_scale * 78.233
+            )
+            * 43758.5453
+            % 1.0
+        )
+        offset = noise * noise_amplitude
+        out[i, 0] = base_x + nx * offset
+        out[i, 1] = base_y + ny * offset
+    return out
+
+
+@njit(cache=True)
+def _perturb_circle_kernel(
+    cx: float,
+    cy: float,
+    radius: float,
+    noise_scale: float,
+    noise_amplitude: float,
+    num_points: int,
+) -> np.ndarray:
+    """Scalar-loop form of `perturb_circle` for Numba; returns an (N, 2) array."""
+    out = np.empty((num_points, 2))
+    step = 2 * math.pi / num_points
+    for i in range(num_points):
+        angle = i * step
+        ca = math.cos(angle)
+        sa = math.sin(angle)
+        noise = (
+            math.sin(
+                (cx * noise_scale + ca) * 12.9898 + (cy * noise_scale + sa) * 78.233
+            )
+            * 43758.5453
+            % 1.0
+        )
+        r = radius + noise * noise_amplitude
+        out[i, 0] = cx + r * ca
+        out[i, 1] = cy + r * sa
+    return out
 
 
 def perturb_line(
     x1: float, y1: float, x2: float, y2: float, config: SketchConfig
-) -> list[tuple[float, float]]:
+) -> np.ndarray:
     """
     Apply wabi-sabi perturbation to a line segment.
 
-    Returns a polyline with intermediate points that have
-    noise applied perpendicular to the line direction.
+    Returns a polyline, as an (N, 2) array, with intermediate points
+    that have noise applied perpendicular to the line direction.
     """
     dx = x2 - x1
     dy = y2 - y1
     length = math.hypot(dx, dy)
 
     if length < 0.001:
-        return [(x1, y1), (x2, y2)]
+        return np.array([(x1, y1), (x2, y2)], dtype=np.float64)
 
     nx = -dy / length
     ny = dx / length
 
     num_points = max(3, int(length * 20))
 
-    points = []
-    for i in range(num_points + 1):
-        t = i / num_points
-        base_x = x1 + dx * t
-        base_y = y1 + dy * t
-
-        noise_val = simplex_noise_2d(
-            base_x * config.noise_scale + t, base_y * config.noise_scale, config.seed
+    if HAS_NUMBA:
+        return _perturb_line_kernel(
+            x1, y1, x2, y2, config.noise_scale, config.noise_amplitude, num_points
         )
 
-        offset = noise_val * config.noise_amplitude
+    t = np.linspace(0.0, 1.0, num_points + 1)
+    base_x = x1 + dx * t
+    base_y = y1 + dy * t
 
-        points.append((base_x + nx * offset, base_y + ny * offset))
+    noise = _noise_2d(base_x * config.noise_scale + t, base_y * config.noise_scale)
+    offset = noise * config.noise_amplitude
 
-    return points
+    return np.column_stack((base_x + nx * offset, base_y + ny * offset))
 
 
 def perturb_circle(
     cx: float, cy: float, radius: float, config: SketchConfig, num_points: int = 60
-) -> list[tuple[float, float]]:
-    """Apply wabi-sabi perturbation to a circle."""
-    points = []
-    for i in range(num_points):
-        angle = (i / num_points) * 2 * math.pi
+) -> np.ndarray:
+    """
+    Apply wabi-sabi perturbation to a circle, returning an (N, 2) array.
 
-        noise_val = simplex_noise_2d(
-            cx * config.noise_scale + math.cos(angle),
-            cy * config.noise_scale + math.sin(angle),
-            config.seed,
+    A ``num_points`` of zero or less gives an empty (0, 2) path.
+    """
+    if num_points <= 0:
+        return np.empty((0, 2))
+    if HAS_NUMBA:
+        return _perturb_circle_kernel(
+            cx, cy, radius, config.noise_scale, config.noise_amplitude, num_points
         )
 
-        r = radius + noise_val * config.noise_amplitude
+    angles = np.arange(num_points) * (2 * math.pi / num_points)
+    ca = np.cos(angles)
+    sa = np.sin(angles)
 
-        points.append((cx + r * math.cos(angle), cy + r * math.sin(angle)))
+    noise = _noise_2d(cx * config.noise_scale + ca, cy * config.noise_scale + sa)
+    r = radius + noise * config.noise_amplitude
 
-    return points
+    return np.column_stack((cx + r * ca, cy + r * sa))
 
 
 class WabiSketch:
@@ -91,15 +168,11 @@ class WabiSketch:
     def __init__(self, config: SketchConfig | None = None):
         self.config = config or SketchConfig()
 
-    def sketch_line(
-        self, x1: float, y1: float, x2: float, y2: float
-    ) -> list[tuple[float, float]]:
+    def sketch_line(self, x1: float, y1: float, x2: float, y2: float) -> np.ndarray:
         """Sketch a line with wabi-sabi effect."""
         return perturb_line(x1, y1, x2, y2, self.config)
 
-    def sketch_circle(
-        self, cx: float, cy: float, radius: float
-    ) -> list[tuple[float, float]]:
+    def sketch_circle(self, cx: float, cy: float, radius: float) -> np.ndarray:
         """Sketch a circle with wabi-sabi effect."""
         return perturb_circle(cx, cy, radius, self.config)
 
@@ -112,26 +185,19 @@ class WabiSketch:
         cx: float,
         cy: float,
         radius: float,
-    ) -> list[tuple[float, float]]:
-        """Sketch an arc with wabi-sabi effect."""
+    ) -> np.ndarray:
+        """Sketch an arc with wabi-sabi effect, returning an (N, 2) array."""
+        config = self.config
         start_angle = math.atan2(y1 - cy, x1 - cx)
         end_angle = math.atan2(y2 - cy, x2 - cx)
 
         num_points = max(10, int(radius * 5))
 
-        points = []
-        for i in range(num_points + 1):
-            t = i / num_points
-            angle = start_angle + (end_angle - start_angle) * t
-
-            noise_val = simplex_noise_2d(
-                cx * self.config.noise_scale + math.cos(angle),
-                cy * self.config.noise_scale + math.sin(angle),
-                self.config.seed,
-            )
-
-            r = radius + noise_val * self.config.noise_amplitude
+        angles = np.linspace(start_angle, end_angle, num_points + 1)
+        ca = np.cos(angles)
+        sa = np.sin(angles)
 
-            points.append((cx + r * math.cos(angle), cy + r * math.sin(angle)))
+        noise = _noise_2d(cx * config.noise_scale + ca, cy * config.noise_scale + sa)
+        r = radius + noise * config.noise_amplitude
 
-        return points
+        return np.column_stack((cx + r * ca, cy + r * sa))
@@ -5,22 +5,30 @@ Supports rendering text with a wabi-sabi aesthetic using
 bundled Hershey fonts (single-stroke, plottable fonts).
 """
 
+from collections.abc import Iterator
 from dataclasses import dataclass
-from enum import Enum
-from typing import Any
+from enum import IntEnum
+from functools import lru_cache, partial
+from typing import Any, NamedTuple
 
 import numpy as np
 
+from kintsugi._jit import HAS_NUMBA, njit
 
-class HersheyFont(Enum):
-    """Hershey font variants with different styles."""
 
-    ROMAN = "roman"
-    SCRIPT_SIMPLEX = "scriptsx"
-    SCRIPT_COMPLEX = "scriptc"
-    GOTHIC_ENGLISH = "gothiceng"
-    GOTHIC_GERMAN = "gothicger"
-    GOTHIC_ITALIAN = "gothicit"
+class HersheyFont(IntEnum):
+    """
+    Hershey font variants with different styles.
+
+    Values are dense ids that index the per-font glyph tables.
+    """
+
+    ROMAN = 0
+    SCRIPT_SIMPLEX = 1
+    SCRIPT_COMPLEX = 2
+    GOTHIC_ENGLISH = 3
+    GOTHIC_GERMAN = 4
+    GOTHIC_ITALIAN = 5
 
 
 HERSHEY_FONTS: dict[HersheyFont, dict[str, Any]] = {
@@ -39,9 +47,14 @@ HERSHEY_FONTS: dict[HersheyFont, dict[str, Any]] = {
 }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TextConfig:
-    """Configuration for hand-drawn text rendering."""
+    """
+    Configuration for hand-drawn text rendering.
+
+    Configs are immutable and hashable; assign a new one to
+    ``HandTextRenderer.config`` to change how text is drawn.
+    """
 
     font: HersheyFont = HersheyFont.ROMAN
     size: float = 12.0
@@ -49,6 +62,43 @@ class TextConfig:
     word_spacing: float = 2.0
     baseline_offset: float = 0.0
     wobble: float = 0.3
+    seed: int | None = None
+
+
+@dataclass(slots=True, frozen=True, eq=False)
+class Strokes:
+    """
+    Rendered stroke paths in CSR form.
+
+    All points live in one ``(N, 2)`` float32 array, and stroke ``i``
+    spans rows ``offsets[i]:offsets[i + 1]``. Iterating or indexing
+    yields per-stroke views without copying. Instances compare and hash
+    by identity; compare ``points`` and ``offsets`` for value equality.
+    """
+
+    points: np.ndarray
+    offsets: np.ndarray
+
+    @classmethod
+    def empty(cls) -> "Strokes":
+        return cls(
+            points=np.empty((0, 2), dtype=np.float32),
+            offsets=np.zeros(1, dtype=np.intp),
+        )
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        if not len(self):
+            return iter(())
+        return iter(np.split(self.points, self.offsets[1:-1]))
+
+    def __getitem__(self, index: int) -> np.ndarray:
+        if not -len(self) <= index < len(self):
+            raise IndexError("stroke index out of range")
+        index %= len(self)
+        return self.points[self.offsets[index] : self.offsets[index + 1]]
 
 
 ROMAN_LETTERS: dict[str, list[list[tuple[float, float]]]] = {
@@ -178,62 +228,312 @@ ROMAN_LETTERS: dict[str, list[list[tuple[float, float]]]] = {
 }
 
 
+def _freeze(arr: np.ndarray) -> np.ndarray:
+    """Mark a module-level table read-only and return it."""
+    arr.flags.writeable = False
+    return arr
+
+
+# Glyph coordinates sit on a 1/20 grid of the unit cell, so they are stored
+# as int8 grid steps and dequantized by the placement multiply
+_GLYPH_SCALE = 0.05
+
+
+class _GlyphTable(NamedTuple):
+    """
+    One font's glyphs as read-only CSR arrays.
+
+    ``points`` holds all vertices as one (M, 2) int8 array of
+    ``_GLYPH_SCALE`` grid steps;
+    ``glyph_start`` and ``stroke_start`` give vertex offsets per glyph and
+    per stroke; ``glyph_stroke`` gives stroke offsets per glyph; and
+    ``ascii_lut`` maps ASCII codes (both cases) to glyph ids, -1 if missing.
+    """
+
+    points: np.ndarray
+    glyph_start: np.ndarray
+    stroke_start: np.ndarray
+    glyph_stroke: np.ndarray
+    ascii_lut: np.ndarray
+
+
+def _build_glyph_table(
+    letters: dict[str, list[list[tuple[float, float]]]],
+) -> _GlyphTable:
+    """
+    Flatten a glyph dict into a read-only glyph table.
+
+    Raises:
+        ValueError: If a glyph point does not lie on the ``_GLYPH_SCALE``
+            grid within the int8 range.
+    """
+    glyphs = list(letters.values())
+    strokes = [stroke for glyph in glyphs for stroke in glyph]
+    coords = np.array([pt for stroke in strokes for pt in stroke]) / _GLYPH_SCALE
+    steps = np.rint(coords)
+    if not np.allclose(coords, steps) or np.abs(steps).max(initial=0) > 127:
+        raise ValueError(f"Glyph points must be int8 multiples of {_GLYPH_SCALE}")
+    points = steps.astype(np.int8)
+    stroke_start = np.cumsum([0, *(len(s) for s in strokes)], dtype=np.int32)
+    glyph_stroke = np.cumsum([0, *(len(g) for g in glyphs)], dtype=np.int32)
+    glyph_start = stroke_start[glyph_stroke]
+
+    ascii_lut = np.full(128, -1, dtype=np.int32)
+    for gid, char in enumerate(letters):
+        for variant in {char, char.lower()}:
+            if ord(variant) < 128:
+                ascii_lut[ord(variant)] = gid
+
+    return _GlyphTable(
+        _freeze(points),
+        _freeze(glyph_start),
+        _freeze(stroke_start),
+        _freeze(glyph_stroke),
+        _freeze(ascii_lut),
+    )
+
+
+_ROMAN_TABLE = _build_glyph_table(ROMAN_LETTERS)
+
+# Indexed by HersheyFont id. Only Roman glyph data is bundled so far; the
+# other fonts draw with it until their stroke tables are added.
+_GLYPH_TABLES: tuple[_GlyphTable, ...] = tuple(_ROMAN_TABLE for _ in HersheyFont)
+
+
+@lru_cache(maxsize=512)
+def _canonical_glyph(font_id: int, gid: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Unit-size glyph in CSR form.
+
+    Returns ``(vertices, stroke_offsets)``: a read-only view of the
+    glyph's (n, 2) int8 grid vertices in the font's table, plus the
+    indices at which each stroke after the first begins.
+    """
+    table = _GLYPH_TABLES[font_id]
+    start, end = table.glyph_start[gid], table.glyph_start[gid + 1]
+    first, last = table.glyph_stroke[gid], table.glyph_stroke[gid + 1]
+    offsets = _freeze(table.stroke_start[first + 1 : last] - start)
+    return table.points[start:end], offsets
+
+
+def _make_rng(seed: int | None) -> np.random.Generator:
+    """Wobble generator; ``None`` seeds from fresh OS entropy."""
+    return np.random.Generator(np.random.PCG64DXSM(seed))
+
+
+def _place_vertices(
+    verts: np.ndarray,
+    scale: float,
+    ox: np.ndarray,
+    oy: float,
+    noise: np.ndarray,
+    wobble: float,
+    out: np.ndarray,
+) -> np.ndarray:
+    """
+    Map glyph vertices into drawing space with NumPy.
+
+    Glyphs are y-up and drawing space is y-down, so x is
+    ``verts.x * scale + ox`` per vertex and y is ``oy - verts.y * scale``,
+    each plus ``noise * wobble``, written into the float32 ``out``.
+
+    Works entirely through ``out=`` ufuncs and scales ``noise`` in place
+    unless ``wobble`` is 1, so callers pass noise they own.
+    """
+    np.multiply(verts, (scale, -scale), out=out)
+    np.add(out[:, 0], ox, out=out[:, 0])
+    np.add(out[:, 1], oy, out=out[:, 1])
+    if wobble != 1.0:
+        np.multiply(noise, wobble, out=noise)
+    np.add(out, noise, out=out)
+    return out
+
+
+@njit(fastmath=True, cache=True)
+def _transform_wobble(
+    verts: np.ndarray,
+    scale: float,
+    ox: np.ndarray,
+    oy: float,
+    noise: np.ndarray,
+    wobble: float,
+    out: np.ndarray,
+) -> None:
+    """Fused scale, y-flip, translate and wobble kernel for Numba."""
+    for i in range(verts.shape[0]):
+        out[i, 0] = verts[i, 0] * scale + ox[i] + noise[i, 0] * wobble
+        out[i, 1] = oy - verts[i, 1] * scale + noise[i, 1] * wobble
+
+
+def _place_glyphs(
+    verts: np.ndarray,
+    ox: np.ndarray,
+    oy: float,
+    noise: np.ndarray,
+    out: np.ndarray | None,
+    *,
+    step: float,
+    wobble: float,
+) -> np.ndarray:
+    """
+    Place glyph vertices with the Numba kernel, or NumPy without it.
+
+    Renderers bind ``step`` and ``wobble`` once per config with
+    `functools.partial`; allocates ``out`` when it is None.
+    """
+    if out is None:
+        out = np.empty((len(verts), 2), dtype=np.float32)
+    if HAS_NUMBA:
+        _transform_wobble(verts, step, ox, oy, noise, wobble, out)
+        return out
+    return _place_vertices(verts, step, ox, oy, noise, wobble, out)
+
+
 class HandTextRenderer:
     """Renders text with a hand-drawn wabi-sabi aesthetic."""
 
     def __init__(self, config: TextConfig | None = None):
         self.config = config or TextConfig()
+        self._scratch = np.empty((0, 2), dtype=np.float32)
+
+    @property
+    def config(self) -> TextConfig:
+        """Active text configuration."""
+        return self._config
+
+    @config.setter
+    def config(self, config: TextConfig) -> None:
+        # Snapshot the derived scalars so the render paths read plain floats
+        # instead of chasing config attributes on every call, and restart the
+        # wobble stream from the new config's seed
+        self._config = config
+        self._rng = _make_rng(config.seed)
+        self._font_id = int(config.font)
+        self._glyphs = _GLYPH_TABLES[self._font_id]
+        self._scale = float(config.size) / 12.0
+        self._spacing = self._scale * float(config.letter_spacing)
+        step = self._scale * _GLYPH_SCALE
+        self._place = partial(_place_glyphs, step=step, wobble=float(config.wobble))
+        self._place_unit = partial(_place_glyphs, step=step, wobble=1.0)
+
+    def _noise(self, count: int, seed: int | None) -> np.ndarray:
+        """Draw unit wobble noise in [-0.5, 0.5) for ``count`` points."""
+        rng = self._rng if seed is None else _make_rng(seed)
+        noise = rng.random((count, 2), dtype=np.float32)
+        return np.subtract(noise, 0.5, out=noise)
 
-    def _wobble_point(self, x: float, y: float, seed: int) -> tuple[float, float]:
-        """Apply small random wobble to a point."""
-        np.random.seed(seed)
-        dx = (np.random.random() - 0.5) * self.config.wobble
-        dy = (np.random.random() - 0.5) * self.config.wobble
-        return (x + dx, y + dy)
+    def _scratch_rows(self, count: int) -> np.ndarray:
+        """Leading ``count`` rows of the shared scratch buffer."""
+        if count > self._scratch.shape[0]:
+            # Grow geometrically so a stream of longer strings reallocates
+            # only a logarithmic number of times
+            capacity = max(count, 2 * self._scratch.shape[0])
+            self._scratch = np.empty((capacity, 2), dtype=np.float32)
+        return self._scratch[:count]
 
     def render_character(
-        self, char: str, x: float, y: float, seed: int = 0
-    ) -> list[list[tuple[float, float]]]:
-        """Render a single character as stroke paths."""
-        char_upper = char.upper()
-        if char_upper not in ROMAN_LETTERS:
-            return []
-
-        strokes = ROMAN_LETTERS[char_upper]
-        scale = self.config.size / 12.0
-
-        rendered = []
-        for stroke in strokes:
-            path = []
-            for px, py in stroke:
-                sx = x + px * scale
-                sy = y - py * scale + scale
-                sx, sy = self._wobble_point(sx, sy, seed)
-                path.append((sx, sy))
-            rendered.append(path)
-
-        return rendered
+        self,
+        char: str,
+        x: float,
+        y: float,
+        seed: int | None = None,
+        wobble: np.ndarray | None = None,
+    ) -> Strokes:
+        """
+        Render a single character as stroke paths.
+
+        Each stroke is an ``(n, 2)`` float32 array of ``(x, y)`` points;
+        an unknown character renders as no strokes.
+
+        ``wobble`` may supply precomputed per-vertex offsets of shape
+        ``(n, 2)``; otherwise they are drawn from the renderer's random
+        generator, or from a fresh generator seeded with ``seed`` when
+        one is given.
+
+        Raises:
+            ValueError: If ``wobble`` does not have one row per glyph vertex.
+        """
+        if len(char) != 1:
+            return Strokes.empty()
+        # Non-ASCII clamps to DEL, which has no glyph
+        gid = int(self._glyphs.ascii_lut[min(ord(char), 0x7F)])
+        if gid < 0:
+            return Strokes.empty()
+
+        verts, offsets = _canonical_glyph(self._font_id, gid)
+        ox = np.full(len(verts), x)
+        oy = y + self._scale
+
+        if wobble is None:
+            pts = self._place(verts, ox, oy, self._noise(len(verts), seed), None)
+        else:
+            # The Numba kernel does not bounds-check, so a short array would
+            # read past its end instead of failing
+            if np.shape(wobble) != (len(verts), 2):
+                raise ValueError(
+                    f"wobble must have shape ({len(verts)}, 2) for {char!r}, "
+                    f"got {np.shape(wobble)}"
+                )
+            pts = self._place_unit(verts, ox, oy, wobble, None)
+
+        return Strokes(pts, np.concatenate(([0], offsets, [len(pts)])))
 
     def render_text(
-        self, text: str, x: float, y: float
-    ) -> list[list[tuple[float, float]]]:
-        """Render a string of text as stroke paths."""
-        scale = self.config.size / 12.0
-        spacing = scale * self.config.letter_spacing
+        self, text: str, x: float, y: float, seed: int | None = None, copy: bool = True
+    ) -> Strokes:
+        """
+        Render a string of text as stroke paths.
+
+        Strokes are ``(n, 2)`` float32 arrays, as for ``render_character``.
+
+        All glyphs are gathered into one vertex buffer, translated to
+        their character positions and wobbled in a single pass. Wobble
+        is drawn from the renderer's random generator, or from a fresh
+        generator seeded with ``seed`` when one is given.
+
+        With ``copy=False`` the strokes are views into a scratch buffer
+        owned by the renderer, which avoids a per-call allocation but is
+        overwritten by the next ``render_text`` call. Consume or copy
+        the strokes before rendering again.
+        """
+        spacing = self._spacing
 
-        all_strokes = []
-        current_x = x
-        char_seed = 0
+        # Codes above ASCII clamp to 127 (DEL), which has no glyph, so every
+        # character resolves with one gather and no per-character branching
+        codes = np.fromiter(map(ord, text), dtype=np.int64, count=len(text))
+        gids = self._glyphs.ascii_lut[np.minimum(codes, 0x7F)]
+        advances = np.where(codes == ord(" "), 2.0, 1.5)
+        np.multiply(advances, spacing, out=advances)
+        char_x = np.cumsum(advances)
+        np.subtract(char_x, advances, out=char_x)
+        np.add(char_x, x, out=char_x)
 
-        for char in text:
-            if char == " ":
-                current_x += spacing * 2
-                continue
+        # Gather every drawn glyph's vertices and stroke starts with one
+        # fancy index each: an arange over the output, shifted per glyph by
+        # the gap between its table start and its base in the output
+        table = self._glyphs
+        drawn = gids >= 0
+        glyph_ids, glyph_x = gids[drawn], char_x[drawn]
+        starts = table.glyph_start[glyph_ids]
+        counts = table.glyph_start[glyph_ids + 1] - starts
+        if not counts.size:
+            return Strokes.empty()
+        bases = np.cumsum(counts) - counts
+        shift = starts - bases
+        verts = table.points[np.arange(counts.sum()) + np.repeat(shift, counts)]
+        ox = np.repeat(glyph_x, counts)
 
-            strokes = self.render_character(char, current_x, y, seed=char_seed)
-            all_strokes.extend(strokes)
+        first = table.glyph_stroke[glyph_ids]
+        strokes = table.glyph_stroke[glyph_ids + 1] - first
+        stroke_ids = np.arange(strokes.sum()) - np.repeat(
+            np.cumsum(strokes) - strokes - first, strokes
+        )
+        offsets = np.append(
+            table.stroke_start[stroke_ids] - np.repeat(shift, strokes), len(verts)
+        )
 
-            current_x += spacing * 1.5
-            char_seed += 1
+        noise = self._noise(len(verts), seed)
+        out = None if copy else self._scratch_rows(len(verts))
+        pts = self._place(verts, ox, y + self._scale, noise, out)
 
-        return all_strokes
+        return Strokes(pts, offsets)
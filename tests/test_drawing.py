@@ -0,0 +1,70 @@
+"""Tests for kintsugi drawing module."""
+
+import numpy as np
+import pytest
+
+from kintsugi.drawing import Drawing, to_shop_fraction
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (0.625, '5/8"'),
+        (1.75, '1 3/4"'),
+        (3.0, '3"'),
+        (0.0, '0"'),
+        (-1.5, '-1 1/2"'),
+        (2.999, '3"'),
+        (-0.01, '0"'),
+        (1 / 3, '5/16"'),
+        (1 / 32, '1/16"'),
+        (3 / 32, '1/8"'),
+        (5 / 32, '3/16"'),
+        (7 / 32, '1/4"'),
+        (1 + 1 / 32, '1 1/16"'),
+        (-1 / 32, '-1/16"'),
+    ],
+)
+def test_to_shop_fraction(value, expected):
+    """Test decimal inches format as shop fractions."""
+    assert to_shop_fraction(value) == expected
+
+
+def test_to_shop_fraction_precision():
+    """Test the denominator limit is respected."""
+    assert to_shop_fraction(0.53125, precision=32) == '17/32"'
+    assert to_shop_fraction(0.53125, precision=8) == '1/2"'
+    assert to_shop_fraction(0.55, precision=16) == '9/16"'
+
+
+def test_drawing_builders_chain():
+    """Test add_* methods return the drawing for chaining."""
+    drawing = Drawing().add_dimension(0, 0, 10, 0).add_centerline(0, 5, 10, 5)
+    assert len(drawing.dimensions) == 1
+    assert len(drawing.centerlines) == 1
+
+
+def test_paths_stored_as_arrays():
+    """Test sketch and text paths are normalised to (N, 2) float32 arrays."""
+    drawing = Drawing()
+    drawing.add_sketch_path([(0, 0), (1, 2), (3, 4)])
+    drawing.add_text_path([])
+    assert drawing.sketch_paths[0].shape == (3, 2)
+    assert drawing.sketch_paths[0].dtype == np.float32
+    assert drawing.text_paths[0].shape == (0, 2)
+
+
+@pytest.mark.parametrize("path", [[(0, 0, 0), (1, 1, 1)], [0, 1, 2, 3], [[[0, 0]]]])
+def test_malformed_paths_are_rejected(path):
+    """Test paths that are not (x, y) pairs raise instead of reshaping."""
+    with pytest.raises(ValueError, match=r"\(x, y\) points"):
+        Drawing().add_sketch_path(path)
+
+
+def test_drawings_with_equal_paths_compare_equal():
+    """Test equality compares stored path arrays point for point."""
+    a = Drawing().add_sketch_path([(0, 0), (1, 1)]).add_text_path([(2, 2), (3, 3)])
+    b = Drawing().add_sketch_path([(0, 0), (1, 1)]).add_text_path([(2, 2), (3, 3)])
+    assert a == b
+    assert a != Drawing().add_sketch_path([(0, 0), (1, 2)])
+    assert a != Drawing(width=600).add_sketch_path([(0, 0), (1, 1)])
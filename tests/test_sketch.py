@@ -1,6 +1,10 @@
 """Tests for kintsugi sketch module."""
 
-from kintsugi.sketch import SketchConfig, WabiSketch
+import numpy as np
+import pytest
+
+from kintsugi import sketch
+from kintsugi.sketch import SketchConfig, WabiSketch, simplex_noise_2d
 
 
 def test_wabisketch_default_config():
@@ -43,9 +47,47 @@ def test_sketch_circle_returns_points():
     assert abs(points[0][1] - points[-1][1]) < 5
 
 
+@pytest.mark.parametrize("has_numba", [True, False])
+def test_perturb_circle_without_points_is_empty(monkeypatch, has_numba):
+    """Test a circle sampled at no points gives an empty path."""
+    monkeypatch.setattr(sketch, "HAS_NUMBA", has_numba)
+    for num_points in (0, -3):
+        path = sketch.perturb_circle(0, 0, 5, SketchConfig(), num_points=num_points)
+        assert path.shape == (0, 2)
+
+
+def test_sketch_arc_returns_points():
+    """Test that sketch_arc spans from start to end angle."""
+    wabi = WabiSketch(SketchConfig(noise_amplitude=0))
+    points = wabi.sketch_arc(10, 0, 0, 10, 0, 0, 10)
+    assert points.shape[1] == 2
+    np.testing.assert_allclose(points[0], (10, 0), atol=1e-9)
+    np.testing.assert_allclose(points[-1], (0, 10), atol=1e-9)
+
+
 def test_sketch_line_short():
     """Test short line handling."""
     wabi = WabiSketch()
     points = wabi.sketch_line(0, 0, 0.001, 0)
     # Short lines get minimal points (but wabi-sabi adds some)
     assert len(points) >= 2
+
+
+def test_numba_kernels_match_numpy_path(monkeypatch):
+    """Test the JIT kernels and the NumPy fallback agree."""
+    wabi = WabiSketch()
+    results = []
+    for has_numba in (True, False):
+        monkeypatch.setattr(sketch, "HAS_NUMBA", has_numba)
+        results.append(
+            (wabi.sketch_line(3.5, 7.25, 120.0, -40.0), wabi.sketch_circle(50, 60, 25))
+        )
+    (line_jit, circle_jit), (line_np, circle_np) = results
+    np.testing.assert_allclose(line_jit, line_np, atol=1e-6)
+    np.testing.assert_allclose(circle_jit, circle_np, atol=1e-6)
+
+
+def test_simplex_noise_2d_range():
+    """Test noise values fall in [0, 1), including negative inputs."""
+    for x, y in [(0, 0), (1.5, -2.25), (-40, -7), (123.4, 56.7)]:
+        assert 0 <= simplex_noise_2d(x, y) < 1
@@ -0,0 +1,120 @@
+"""Tests for kintsugi SVG export."""
+
+import io
+import re
+
+import numpy as np
+
+from kintsugi.drawing import Drawing
+from kintsugi.export import render_to_svg, svg, write_svg
+
+
+def test_render_empty_drawing():
+    """Test an empty drawing renders a bare SVG document."""
+    svg = render_to_svg(Drawing())
+    assert svg.startswith("<svg")
+    assert svg.endswith("</svg>")
+    assert "<path" not in svg
+
+
+def test_sketch_paths_merge_into_one_element():
+    """Test same-style sketch paths share a single path element."""
+    drawing = Drawing()
+    drawing.add_sketch_path([(0, 0), (10, 0)])
+    drawing.add_sketch_path([(0, 5), (10, 5)])
+    drawing.add_text_path([(1, 1), (2, 2)])
+    svg = render_to_svg(drawing)
+    assert svg.count("<path") == 2
+    assert 'd="M 0.00,0.00 L 10.00,0.00 M 0.00,5.00 L 10.00,5.00"' in svg
+
+
+def test_directly_appended_point_lists_render():
+    """Test plain point lists appended to the path fields still export."""
+    drawing = Drawing()
+    drawing.sketch_paths.append([(0, 0), (1, 1)])
+    drawing.text_paths.append([(2, 2), (3, 3)])
+    out = render_to_svg(drawing, cache=True)
+    assert 'd="M 0.00,0.00 L 1.00,1.00"' in out
+    assert 'd="M 2.00,2.00 L 3.00,3.00"' in out
+    assert drawing._svg_cache == {}
+
+
+def test_render_precision():
+    """Test coordinate precision is configurable."""
+    drawing = Drawing()
+    drawing.add_sketch_path([(0.14, 0), (10.46, 3.26)])
+    assert 'd="M 0.1,0.0 L 10.5,3.3"' in render_to_svg(drawing, precision=1)
+    assert 'd="M 0,0 L 10,3"' in render_to_svg(drawing, precision=0)
+
+
+def test_dimensions_share_arrow_marker():
+    """Test arrow heads come from one marker definition."""
+    drawing = Drawing()
+    drawing.add_dimension(0, 0, 100, 0, label='1"')
+    drawing.add_dimension(0, 0, 0, 100, label='1"')
+    svg = render_to_svg(drawing)
+    assert svg.count("<marker") == 1
+    assert svg.count('marker-end="url(#dim-arrow)"') == 2
+
+
+def test_hatch_clip_ids_are_unique():
+    """Test each hatch region gets its own clip path."""
+    drawing = Drawing()
+    drawing.add_hatch(0, 0, 50, 50)
+    drawing.add_hatch(100, 0, 50, 50)
+    svg = render_to_svg(drawing)
+    ids = re.findall(r'clipPath id="([^"]+)"', svg)
+    assert len(ids) == 2
+    assert len(set(ids)) == 2
+    assert render_to_svg(drawing) == svg
+
+
+def test_write_svg_matches_render_to_svg():
+    """Test streaming output is identical to the string renderer."""
+    drawing = Drawing()
+    drawing.add_sketch_path([(0, 0), (10, 0)])
+    drawing.add_dimension(0, 0, 100, 0, label='1"')
+    drawing.add_label("A", 5, 5)
+    buf = io.StringIO()
+    write_svg(drawing, buf)
+    assert buf.getvalue() == render_to_svg(drawing)
+
+
+def test_unchanged_paths_reuse_cached_path_data(monkeypatch):
+    """Test re-rendering only formats paths added since the last render."""
+    drawing = Drawing()
+    drawing.add_sketch_path([(0, 0), (10, 0)])
+    first = render_to_svg(drawing, cache=True)
+
+    calls = []
+    original = svg._points_to_svg
+    monkeypatch.setattr(
+        svg, "_points_to_svg", lambda *args: calls.append(args) or original(*args)
+    )
+    assert render_to_svg(drawing, cache=True) == first
+    assert calls == []
+
+    drawing.add_sketch_path([(0, 5), (10, 5)])
+    render_to_svg(drawing, cache=True)
+    assert len(calls) == 1
+
+
+def test_path_cache_is_opt_in():
+    """Test a default render keeps no path data on the drawing."""
+    drawing = Drawing().add_sketch_path([(0, 0), (10, 0)])
+    render_to_svg(drawing)
+    assert drawing._svg_cache == {}
+    render_to_svg(drawing, cache=True)
+    assert len(drawing._svg_cache) == 1
+
+
+def test_read_only_views_are_not_cached():
+    """Test paths the builders did not store are re-formatted each render."""
+    base = np.array([[0.0, 0.0], [1.0, 1.0]])
+    view = base.view()
+    view.flags.writeable = False
+    drawing = Drawing()
+    drawing.sketch_paths.append(view)
+    assert 'd="M 0.00,0.00 L 1.00,1.00"' in render_to_svg(drawing, cache=True)
+    base[1] = (2.0, 2.0)
+    assert 'd="M 0.00,0.00 L 2.00,2.00"' in render_to_svg(drawing, cache=True)
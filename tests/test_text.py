@@ -1,5 +1,11 @@
 """Tests for kintsugi text module."""
 
+import dataclasses
+
+import numpy as np
+import pytest
+
+from kintsugi import text
 from kintsugi.text import HandTextRenderer, HersheyFont, TextConfig
 
 
@@ -19,6 +25,39 @@ def test_text_renderer_custom_config():
     assert renderer.config.wobble == 0.5
 
 
+def test_text_config_is_frozen():
+    """Test configs are immutable and usable as cache keys."""
+    config = TextConfig(size=24)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        config.size = 12  # type: ignore[misc]
+    assert hash(config) == hash(TextConfig(size=24))
+
+
+def test_config_swap_rescales_text():
+    """Test assigning a new config takes effect on the next render."""
+    renderer = HandTextRenderer(TextConfig(wobble=0.0))
+    small = renderer.render_character("A", 0, 0).points
+    renderer.config = TextConfig(size=24, wobble=0.0)
+    large = renderer.render_character("A", 0, 0).points
+    np.testing.assert_allclose(np.ptp(large, axis=0), 2 * np.ptp(small, axis=0))
+
+
+def test_fonts_without_glyph_data_fall_back_to_roman():
+    """Test every font id resolves to a glyph table."""
+    for font in HersheyFont:
+        renderer = HandTextRenderer(TextConfig(font=font, seed=0))
+        assert len(renderer.render_character("A", 0, 0)) > 0
+
+
+def test_glyph_points_stored_as_int8_grid():
+    """Test glyphs quantize losslessly and render onto the grid."""
+    assert text._GLYPH_TABLES[HersheyFont.ROMAN].points.dtype == np.int8
+    renderer = HandTextRenderer(TextConfig(size=24, wobble=0.0))
+    pts = renderer.render_text("KINTSUGI 42", 0, 0).points
+    step = 2.0 * text._GLYPH_SCALE
+    np.testing.assert_allclose(pts / step, np.rint(pts / step), atol=1e-4)
+
+
 def test_render_character():
     """Test rendering a single character."""
     renderer = HandTextRenderer()
@@ -26,6 +65,42 @@ def test_render_character():
     assert len(strokes) > 0  # A has multiple strokes
 
 
+def test_strokes_index_into_flat_points():
+    """Test Strokes slices its flat points by offsets."""
+    strokes = text.Strokes(
+        np.arange(10, dtype=np.float32).reshape(5, 2), np.array([0, 2, 5])
+    )
+    assert len(strokes) == 2
+    np.testing.assert_array_equal(strokes[-1], [[4, 5], [6, 7], [8, 9]])
+    assert [len(s) for s in strokes] == [2, 3]
+    with pytest.raises(IndexError):
+        strokes[2]
+
+
+def test_empty_strokes_iterate_as_no_strokes():
+    """Test empty Strokes yields nothing rather than one empty stroke."""
+    renderer = HandTextRenderer()
+    assert list(text.Strokes.empty()) == []
+    assert list(renderer.render_character("@", 0, 0)) == []
+    assert list(renderer.render_text("  ", 0, 0)) == []
+
+
+def test_strokes_compare_by_identity():
+    """Test Strokes equality and hashing never touch the arrays."""
+    a = HandTextRenderer().render_text("AB", 0, 0, seed=1)
+    b = HandTextRenderer().render_text("AB", 0, 0, seed=1)
+    assert a == a and a != b
+    assert len({a, b}) == 2
+
+
+def test_strokes_are_point_arrays():
+    """Test strokes come back as (n, 2) float32 arrays."""
+    renderer = HandTextRenderer()
+    for stroke in renderer.render_text("A1", 0, 0):
+        assert stroke.dtype == np.float32
+        assert stroke.ndim == 2 and stroke.shape[1] == 2
+
+
 def test_render_text():
     """Test rendering a string."""
     renderer = HandTextRenderer()
@@ -33,8 +108,95 @@ def test_render_text():
     assert len(strokes) > 0
 
 
+def test_render_text_matches_per_character_render():
+    """Test the vectorized gather places glyphs like render_character."""
+    renderer = HandTextRenderer(TextConfig(wobble=0.0))
+    line = renderer.render_text("A@ 1B", 0, 0)
+    chars = [
+        renderer.render_character(char, x, 0)
+        for char, x in [("A", 0), ("1", 5), ("B", 6.5)]
+    ]
+    np.testing.assert_allclose(line.points, np.vstack([c.points for c in chars]))
+    assert len(line) == sum(len(c) for c in chars)
+
+
 def test_render_unknown_character():
     """Test rendering unknown character returns empty."""
     renderer = HandTextRenderer()
     strokes = renderer.render_character("@", 0, 0)
-    assert strokes == []
+    assert len(strokes) == 0
+
+
+def test_render_text_seed_is_reproducible():
+    """Test an explicit seed gives identical wobble across renderers."""
+    a = HandTextRenderer().render_text("AB 12", 0, 0, seed=7)
+    b = HandTextRenderer().render_text("AB 12", 0, 0, seed=7)
+    np.testing.assert_array_equal(a.offsets, b.offsets)
+    np.testing.assert_array_equal(a.points, b.points)
+
+
+def test_config_seed_is_reproducible():
+    """Test renderers sharing a config seed produce identical text."""
+    config = TextConfig(seed=3)
+    a = HandTextRenderer(config).render_text("KINTSUGI", 0, 0)
+    b = HandTextRenderer(config).render_text("KINTSUGI", 0, 0)
+    np.testing.assert_array_equal(a.offsets, b.offsets)
+    np.testing.assert_array_equal(a.points, b.points)
+
+
+def test_render_text_without_copy_reuses_scratch():
+    """Test copy=False returns views that match a copied render."""
+    renderer = HandTextRenderer(TextConfig(seed=5))
+    copied = renderer.render_text("WABI", 0, 0, seed=2)
+    first = renderer.render_text("WABI", 0, 0, seed=2, copy=False)
+    np.testing.assert_array_equal(first.points, copied.points)
+    second = renderer.render_text("WABI", 0, 0, seed=3, copy=False)
+    assert np.shares_memory(first.points, second.points)
+
+
+def test_renderers_with_equal_size_place_identically():
+    """Test placement depends only on size when wobble is off."""
+    a = HandTextRenderer(TextConfig(size=18, wobble=0.0, seed=1))
+    b = HandTextRenderer(TextConfig(size=18, wobble=0.0, seed=2))
+    c = HandTextRenderer(TextConfig(size=20, wobble=0.0, seed=1))
+    text_a, text_b = a.render_text("KINTSUGI", 0, 0), b.render_text("KINTSUGI", 0, 0)
+    np.testing.assert_array_equal(text_a.points, text_b.points)
+    assert not np.array_equal(text_a.points, c.render_text("KINTSUGI", 0, 0).points)
+
+
+def test_supplied_wobble_is_not_modified(monkeypatch):
+    """Test the in-place NumPy path leaves caller wobble untouched."""
+    monkeypatch.setattr(text, "HAS_NUMBA", False)
+    wobble = np.full((5, 2), 0.25, dtype=np.float32)
+    HandTextRenderer().render_character("A", 0, 0, wobble=wobble)
+    np.testing.assert_array_equal(wobble, 0.25)
+
+
+def test_supplied_wobble_shape_is_checked():
+    """Test a wobble array of the wrong shape is rejected."""
+    renderer = HandTextRenderer()
+    with pytest.raises(ValueError, match="wobble must have shape"):
+        renderer.render_character("A", 0, 0, wobble=np.zeros((2, 2), np.float32))
+
+
+def test_config_swap_reseeds_wobble():
+    """Test assigning a seeded config matches a renderer built with it."""
+    renderer = HandTextRenderer(TextConfig(seed=1))
+    renderer.render_text("WABI", 0, 0)
+    renderer.config = TextConfig(seed=5)
+    swapped = renderer.render_text("SABI", 0, 0)
+    fresh = HandTextRenderer(TextConfig(seed=5)).render_text("SABI", 0, 0)
+    np.testing.assert_array_equal(swapped.points, fresh.points)
+
+
+def test_numba_kernel_matches_numpy_path(monkeypatch):
+    """Test the JIT transform and the NumPy fallback agree."""
+    renderer = HandTextRenderer()
+    results = []
+    for has_numba in (True, False):
+        monkeypatch.setattr(text, "HAS_NUMBA", has_numba)
+        results.append(renderer.render_text("WABI 1/2", 3, 40, seed=1))
+    jit, fallback = results
+    assert len(jit) == len(fallback)
+    for a, b in zip(jit, fallback):
+        np.testing.assert_allclose(a, b, atol=1e-6)